@@ -24,11 +24,16 @@ with st.sidebar:
 # Application Logic
 st.subheader("Data Overview")
 
-# Example Data
-data = pd.DataFrame(
-    np.random.randn(10, 5),
-    columns=['Metric A', 'Metric B', 'Metric C', 'Metric D', 'Metric E']
-)
+# Example Data (cached so reruns on widget interaction don't rebuild it)
+@st.cache_data
+def _sample_data():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.standard_normal((10, 5)),
+        columns=['Metric A', 'Metric B', 'Metric C', 'Metric D', 'Metric E']
+    )
+
+data = _sample_data()
 
 st.dataframe(data)
 